@@ -36,6 +36,7 @@ import fiftyone.utils.eta as foue
 mask_utils = fou.lazy_import(
     "pycocotools.mask", callback=lambda: fou.ensure_import("pycocotools")
 )
+ijson = fou.lazy_import("ijson")
 
 
 logger = logging.getLogger(__name__)
@@ -1581,6 +1582,15 @@ def download_coco_dataset_split(
             did_download = True
         else:
             logger.info("Images already downloaded")
+    elif (
+        classes is None
+        and image_ids is None
+        and len(etau.list_files(images_dir)) >= max_samples
+    ):
+        # Any `max_samples` existing images satisfy the request, so there's no
+        # need to load the (potentially huge) annotations
+        logger.info("Sufficient images already downloaded")
+        all_classes = _load_coco_classes(full_anno_path)
     else:
         # Partial image download
 
@@ -1677,19 +1687,23 @@ def download_coco_dataset_split(
         did_download = True
 
     if did_download:
-        if d is None:
-            d = etas.load_json(full_anno_path)
-
-            categories = d.get("categories", None)
-            if categories is not None:
-                all_classes, _ = parse_coco_categories(categories)
-            else:
-                all_classes = None
-
         if num_samples >= split_size:
+            if d is None:
+                # Only the classes are needed, so avoid loading the full file
+                all_classes = _load_coco_classes(full_anno_path)
+
             logger.info("Writing annotations to '%s'", anno_path)
             etau.copy_file(full_anno_path, anno_path)
         else:
+            if d is None:
+                d = etas.load_json(full_anno_path)
+
+                categories = d.get("categories", None)
+                if categories is not None:
+                    all_classes, _ = parse_coco_categories(categories)
+                else:
+                    all_classes = None
+
             logger.info(
                 "Writing annotations for %d downloaded samples to '%s'",
                 num_samples,
@@ -1702,6 +1716,32 @@ def download_coco_dataset_split(
     return num_samples, all_classes, did_download
 
 
+def _load_coco_classes(json_path):
+    # ijson is optional, and its pure-Python backend is much slower than
+    # `json.load()` on large files, so we only stream when its C backend is
+    # available
+    try:
+        use_ijson = ijson.backend == "yajl2_c"
+    except ImportError:
+        use_ijson = False
+
+    if use_ijson:
+        # Streams only the `categories` of the annotations file, which avoids
+        # materializing the (potentially millions of) annotations in memory
+        with open(json_path, "rb") as f:
+            categories = next(
+                ijson.items(f, "categories", use_float=True), None
+            )
+    else:
+        categories = etas.load_json(json_path).get("categories", None)
+
+    if categories is None:
+        return None
+
+    classes, _ = parse_coco_categories(categories)
+    return classes
+
+
 def _merge_dir(indir, outdir):
     etau.ensure_dir(outdir)
     for filename in os.listdir(indir):
@@ -9,6 +9,7 @@ download via FiftyOne.
 |
 """
 from collections import OrderedDict
+from functools import lru_cache
 import logging
 import os
 
@@ -401,8 +402,22 @@ def get_zoo_dataset(name, **kwargs):
 
 
 def _get_zoo_dataset_cls(name):
-    all_datasets = _get_zoo_datasets()
-    all_sources, _ = _get_zoo_dataset_sources()
+    manifest_paths = fo.config.dataset_zoo_manifest_paths
+    manifest_paths = tuple(manifest_paths) if manifest_paths else None
+
+    return _get_zoo_dataset_cls_cached(
+        name, manifest_paths, fo.config.default_ml_backend
+    )
+
+
+# Note that only the manifest *paths* are part of the cache key, so edits to
+# the contents of a manifest file are not picked up until the process restarts
+@lru_cache(maxsize=None)
+def _get_zoo_dataset_cls_cached(name, manifest_paths, default_ml_backend):
+    all_datasets = _load_zoo_datasets(manifest_paths)
+    all_sources, _ = _parse_zoo_dataset_sources(
+        all_datasets, default_ml_backend
+    )
     for source in all_sources:
         if source not in all_datasets:
             continue
@@ -460,6 +475,10 @@ def _parse_splits(split, splits):
 
 
 def _get_zoo_datasets():
+    return _load_zoo_datasets(fo.config.dataset_zoo_manifest_paths)
+
+
+def _load_zoo_datasets(manifest_paths):
     from .base import AVAILABLE_DATASETS as BASE_DATASETS
     from .torch import AVAILABLE_DATASETS as TORCH_DATASETS
     from .tf import AVAILABLE_DATASETS as TF_DATASETS
@@ -469,8 +488,8 @@ def _get_zoo_datasets():
     zoo_datasets["torch"] = TORCH_DATASETS
     zoo_datasets["tensorflow"] = TF_DATASETS
 
-    if fo.config.dataset_zoo_manifest_paths:
-        for manifest_path in fo.config.dataset_zoo_manifest_paths:
+    if manifest_paths:
+        for manifest_path in manifest_paths:
             manifest = _load_zoo_dataset_manifest(manifest_path)
             zoo_datasets.update(manifest)
 
@@ -491,9 +510,13 @@ def _load_zoo_dataset_manifest(manifest_path):
 
 
 def _get_zoo_dataset_sources():
-    all_datasets = _get_zoo_datasets()
+    return _parse_zoo_dataset_sources(
+        _get_zoo_datasets(), fo.config.default_ml_backend
+    )
+
+
+def _parse_zoo_dataset_sources(all_datasets, default_source):
     all_sources = list(all_datasets.keys())
-    default_source = fo.config.default_ml_backend
 
     sources = []
 
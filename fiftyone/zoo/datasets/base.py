@@ -5,25 +5,35 @@ FiftyOne Zoo Datasets provided natively by the library.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import heapq
+import itertools
 import logging
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 import os
 import shutil
+import threading
+import zipfile
+
+import requests
 
 import eta.core.utils as etau
 import eta.core.web as etaw
 
+import fiftyone.core.utils as fou
 import fiftyone.types as fot
-import fiftyone.utils.bdd as foub
-import fiftyone.utils.coco as fouc
-import fiftyone.utils.cityscapes as foucs
 import fiftyone.utils.data as foud
-import fiftyone.utils.hmdb51 as fouh
-import fiftyone.utils.kitti as fouk
-import fiftyone.utils.lfw as foul
-import fiftyone.utils.openimages as fouo
-import fiftyone.utils.ucf101 as fouu
 import fiftyone.zoo.datasets as fozd
 
+foub = fou.lazy_import("fiftyone.utils.bdd")
+fouc = fou.lazy_import("fiftyone.utils.coco")
+foucs = fou.lazy_import("fiftyone.utils.cityscapes")
+fouh = fou.lazy_import("fiftyone.utils.hmdb51")
+fouk = fou.lazy_import("fiftyone.utils.kitti")
+foul = fou.lazy_import("fiftyone.utils.lfw")
+fouo = fou.lazy_import("fiftyone.utils.openimages")
+fouu = fou.lazy_import("fiftyone.utils.ucf101")
+
 
 logger = logging.getLogger(__name__)
 
@@ -1075,10 +1085,15 @@ class LabeledFacesInTheWildDataset(FiftyOneDataset):
         logger.info("Parsing dataset metadata")
         dataset_type = fot.ImageClassificationDirectoryTree()
         importer = foud.ImageClassificationDirectoryTreeImporter
-        classes = sorted(
-            importer._get_classes(os.path.join(dataset_dir, "train"))
-            + importer._get_classes(os.path.join(dataset_dir, "test"))
-        )
+        split_dirs = [os.path.join(dataset_dir, s) for s in ("train", "test")]
+        with ThreadPool(processes=len(split_dirs)) as pool:
+            split_classes = pool.map(importer._get_classes, split_dirs)
+
+        # Each split's classes are already sorted, so merge them rather than
+        # re-sorting
+        classes = [
+            c for c, _ in itertools.groupby(heapq.merge(*split_classes))
+        ]
         num_samples = importer._get_num_samples(split_dir)
         logger.info("Found %d samples", num_samples)
 
@@ -1551,15 +1566,168 @@ def _download_and_extract_archive(
     archive_path = os.path.join(scratch_dir, archive_name)
     if not os.path.exists(archive_path):
         logger.info("Downloading dataset...")
-        etaw.download_google_drive_file(fid, path=archive_path)
+        _download_google_drive_file(fid, archive_path)
     else:
         logger.info("Using existing archive '%s'", archive_path)
 
     logger.info("Extracting dataset...")
-    etau.extract_archive(archive_path)
+    if archive_path.endswith(".zip"):
+        _extract_zip(archive_path, scratch_dir)
+    else:
+        etau.extract_archive(archive_path)
+
     _move_dir(os.path.join(scratch_dir, dir_in_archive), dataset_dir)
 
 
+_GDRIVE_DOWNLOAD_URL = "https://drive.google.com/uc?export=download"
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _download_google_drive_file(
+    fid, path, num_workers=8, min_part_size=16 * 1024 * 1024
+):
+    with requests.Session() as sess:
+        r = _get_google_drive_response(sess, fid)
+        url = r.url
+        status_code = r.status_code
+        range_str = r.headers.get("Content-Range", None)
+        r.close()
+
+        try:
+            # <unit> <range-start>-<range-end>/<size>
+            size = int(range_str.partition("/")[-1])
+        except (AttributeError, ValueError):
+            size = None
+
+        num_parts = min(num_workers, (size or 0) // min_part_size)
+        if status_code != 206 or num_parts < 2:
+            etaw.download_google_drive_file(fid, path=path)
+            return
+
+        _download_ranges(sess, url, path, size, num_parts)
+
+
+def _get_google_drive_response(sess, fid):
+    # Include `Range` in the request so that the response tells us whether
+    # ranged requests are supported, via its status and `Content-Range`.
+    # Passing `confirm=t` skips the virus scan warning page for large files
+    params = {"id": fid, "confirm": "t"}
+    headers = {"Range": "bytes=0-"}
+    r = sess.get(
+        _GDRIVE_DOWNLOAD_URL, params=params, headers=headers, stream=True
+    )
+
+    # Older download warnings must be confirmed via a cookie token
+    for key, token in r.cookies.items():
+        if key.startswith("download_warning"):
+            r.close()
+            params["confirm"] = token
+            r = sess.get(
+                _GDRIVE_DOWNLOAD_URL,
+                params=params,
+                headers=headers,
+                stream=True,
+            )
+            break
+
+    return r
+
+
+def _download_ranges(sess, url, path, size, num_parts):
+    etau.ensure_basedir(path)
+    with open(path, "wb") as f:
+        f.truncate(size)
+
+    part_size = -(-size // num_parts)  # ceil
+    ranges = [
+        (start, min(start + part_size, size) - 1)
+        for start in range(0, size, part_size)
+    ]
+
+    lock = threading.Lock()
+
+    def _download_range(byte_range):
+        start, end = byte_range
+        num_bytes = end - start + 1
+        headers = {"Range": "bytes=%d-%d" % (start, end)}
+
+        # Sessions aren't guaranteed to be thread-safe, so use one per range
+        with requests.Session() as part_sess:
+            part_sess.cookies.update(sess.cookies)
+            r = part_sess.get(url, headers=headers, stream=True)
+            try:
+                content_range = r.headers.get("Content-Range", "")
+                if r.status_code != 206 or not content_range.startswith(
+                    "bytes %d-%d/" % (start, end)
+                ):
+                    raise etaw.WebSessionError("Unable to get '%s'" % url)
+
+                num_written = 0
+                with open(path, "r+b") as f:
+                    f.seek(start)
+                    for chunk in r.iter_content(
+                        chunk_size=_DOWNLOAD_CHUNK_SIZE
+                    ):
+                        num_written += len(chunk)
+                        if num_written > num_bytes:
+                            break
+
+                        f.write(chunk)
+                        with lock:
+                            pb.update(8 * len(chunk))
+
+                if num_written != num_bytes:
+                    raise etaw.WebSessionError(
+                        "Expected %d bytes but received %d from '%s'"
+                        % (num_bytes, num_written, url)
+                    )
+            finally:
+                r.close()
+
+    try:
+        with etau.ProgressBar(8 * size, use_bits=True) as pb:
+            with ThreadPool(processes=len(ranges)) as pool:
+                pool.map(_download_range, ranges, chunksize=1)
+    except:
+        # Don't leave a partial archive behind to be reused by a later call
+        etau.delete_file(path)
+        raise
+
+
+def _extract_zip(zip_path, outdir, num_workers=None):
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+
+    with zipfile.ZipFile(zip_path) as zf:
+        infos = zf.infolist()
+
+    # Create directories up front so that workers don't race to make them
+    outdir = os.path.abspath(outdir)
+    for dirname in set(os.path.dirname(i.filename) for i in infos):
+        dirpath = os.path.abspath(os.path.join(outdir, dirname))
+        if os.path.commonpath([outdir, dirpath]) == outdir:
+            os.makedirs(dirpath, exist_ok=True)
+
+    infos = [i for i in infos if not i.is_dir()]
+
+    num_workers = max(1, min(num_workers, len(infos)))
+    if num_workers == 1:
+        with zipfile.ZipFile(zip_path) as zf:
+            zf.extractall(outdir)
+
+        return
+
+    # Each worker reads from its own handle so that decompression can overlap
+    def _extract_members(members):
+        with zipfile.ZipFile(zip_path) as zf:
+            for info in members:
+                zf.extract(info, outdir)
+
+    chunks = [infos[i::num_workers] for i in range(num_workers)]
+    with ThreadPool(processes=num_workers) as pool:
+        pool.map(_extract_members, chunks, chunksize=1)
+
+
 def _move_dir(src, dst):
     for f in os.listdir(src):
         shutil.move(os.path.join(src, f), dst)
@@ -8,10 +8,11 @@ FiftyOne Zoo Datasets provided by ``tensorflow_datasets``.
 import fiftyone.core.labels as fol
 import fiftyone.core.utils as fou
 import fiftyone.types as fot
-import fiftyone.utils.imagenet as foui
 import fiftyone.utils.data as foud
 import fiftyone.zoo.datasets as fozd
 
+foui = fou.lazy_import("fiftyone.utils.imagenet")
+
 
 _TFDS_IMPORT_ERROR = """
 
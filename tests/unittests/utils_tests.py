@@ -5,17 +5,28 @@ FiftyOne utilities unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import os
+import shutil
 import time
 import unittest
+from unittest import mock
+import zipfile
 
 from mongoengine.errors import ValidationError
 import numpy as np
 
+import eta.core.serial as etas
+import eta.core.utils as etau
+import eta.core.web as etaw
+
 import fiftyone as fo
 import fiftyone.constants as foc
 import fiftyone.core.media as fom
 import fiftyone.core.uid as fou
 from fiftyone.migrations.runner import MigrationRunner
+import fiftyone.utils.coco as fouc
+import fiftyone.zoo.datasets as fozd
+import fiftyone.zoo.datasets.base as fozb
 
 from decorators import drop_datasets
 
@@ -246,6 +257,333 @@ class UIDTests(unittest.TestCase):
         self.assertTrue(fou._import_logged)
 
 
+class COCOTests(unittest.TestCase):
+    def test_load_coco_classes(self):
+        annos = [
+            {
+                "images": [{"id": 1, "file_name": "000001.jpg"}],
+                "annotations": [{"id": 1, "bbox": [0.5, 1.5, 2.0, 3.0]}],
+                "categories": [
+                    {"id": 1, "name": "cat", "supercategory": "animal"},
+                    {"id": 3, "name": "dog", "supercategory": "animal"},
+                ],
+            },
+            {"images": [{"id": 1, "file_name": "000001.jpg"}]},
+        ]
+
+        with etau.TempDir() as tmp_dir:
+            json_path = os.path.join(tmp_dir, "labels.json")
+
+            for d in annos:
+                etas.write_json(d, json_path)
+
+                categories = etas.load_json(json_path).get("categories", None)
+                if categories is not None:
+                    expected, _ = fouc.parse_coco_categories(categories)
+                else:
+                    expected = None
+
+                self.assertEqual(fouc._load_coco_classes(json_path), expected)
+
+                # Non-streaming fallback
+                ijson = mock.Mock(backend="python")
+                with mock.patch.object(fouc, "ijson", ijson):
+                    classes = fouc._load_coco_classes(json_path)
+
+                self.assertEqual(classes, expected)
+                ijson.items.assert_not_called()
+
+                # ijson is not installed
+                ijson = mock.Mock()
+                type(ijson).backend = mock.PropertyMock(
+                    side_effect=ImportError
+                )
+                with mock.patch.object(fouc, "ijson", ijson):
+                    classes = fouc._load_coco_classes(json_path)
+
+                self.assertEqual(classes, expected)
+
+    def test_download_split_existing_images(self):
+        categories = [
+            {"id": 1, "name": "cat", "supercategory": "animal"},
+            {"id": 2, "name": "dog", "supercategory": "animal"},
+        ]
+
+        with etau.TempDir() as tmp_dir:
+            dataset_dir = os.path.join(tmp_dir, "validation")
+            raw_dir = os.path.join(tmp_dir, "raw")
+
+            etas.write_json(
+                {"images": [], "annotations": [], "categories": categories},
+                os.path.join(raw_dir, "instances_val2017.json"),
+            )
+            etau.write_file("{}", os.path.join(dataset_dir, "labels.json"))
+            for idx in range(3):
+                etau.write_file(
+                    b"", os.path.join(dataset_dir, "data", "%012d.jpg" % idx)
+                )
+
+            # The full annotations should not be parsed
+            with mock.patch.object(
+                fouc, "_parse_coco_detection_annotations"
+            ) as parse:
+                (
+                    num_samples,
+                    classes,
+                    did_download,
+                ) = fouc.download_coco_dataset_split(
+                    dataset_dir,
+                    "validation",
+                    year="2017",
+                    max_samples=2,
+                    raw_dir=raw_dir,
+                    scratch_dir=os.path.join(tmp_dir, "scratch"),
+                )
+
+            parse.assert_not_called()
+
+            expected_classes, _ = fouc.parse_coco_categories(categories)
+            self.assertEqual(num_samples, 3)
+            self.assertListEqual(classes, expected_classes)
+            self.assertFalse(did_download)
+
+
+class _MockResponse(object):
+    def __init__(self, status_code, content=b"", headers=None, url=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.url = url
+        self.cookies = {}
+
+    def iter_content(self, chunk_size=1):
+        for idx in range(0, len(self.content), chunk_size):
+            yield self.content[idx : (idx + chunk_size)]
+
+    def close(self):
+        pass
+
+
+class _MockSession(object):
+    """Serves ``content`` over HTTP range requests, optionally failing or
+    truncating the range that starts at ``fail_start`` or ``truncate_start``.
+    """
+
+    url = "https://example.com/file"
+
+    def __init__(
+        self,
+        content,
+        support_ranges=True,
+        fail_start=None,
+        truncate_start=None,
+    ):
+        self.content = content
+        self.support_ranges = support_ranges
+        self.fail_start = fail_start
+        self.truncate_start = truncate_start
+        self.cookies = {}
+        self.params = []
+
+    def __call__(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def get(self, url, params=None, headers=None, stream=False):
+        self.params.append(params)
+
+        size = len(self.content)
+        if not self.support_ranges:
+            return _MockResponse(200, self.content, url=self.url)
+
+        start, end = headers["Range"][len("bytes=") :].split("-")
+        start = int(start)
+        end = int(end) if end else size - 1
+
+        if start == self.fail_start:
+            return _MockResponse(500, url=self.url)
+
+        content = self.content[start : (end + 1)]
+        if start == self.truncate_start:
+            content = content[:-1]
+
+        return _MockResponse(
+            206,
+            content,
+            headers={"Content-Range": "bytes %d-%d/%d" % (start, end, size)},
+            url=self.url,
+        )
+
+
+class ZooDatasetUtilsTests(unittest.TestCase):
+    def test_get_zoo_dataset_cls(self):
+        manifest_paths = fo.config.dataset_zoo_manifest_paths
+        default_ml_backend = fo.config.default_ml_backend
+
+        try:
+            for paths in ([], None):
+                fo.config.dataset_zoo_manifest_paths = paths
+                zoo_dataset_cls = fozd._get_zoo_dataset_cls("quickstart")
+                self.assertIs(zoo_dataset_cls, fozb.QuickstartDataset)
+
+            fo.config.default_ml_backend = "torch"
+            zoo_dataset_cls = fozd._get_zoo_dataset_cls("cifar10")
+            self.assertEqual(
+                etau.get_class_name(zoo_dataset_cls),
+                "fiftyone.zoo.datasets.torch.CIFAR10Dataset",
+            )
+
+            fo.config.default_ml_backend = "tensorflow"
+            zoo_dataset_cls = fozd._get_zoo_dataset_cls("cifar10")
+            self.assertEqual(
+                etau.get_class_name(zoo_dataset_cls),
+                "fiftyone.zoo.datasets.tf.CIFAR10Dataset",
+            )
+        finally:
+            fo.config.dataset_zoo_manifest_paths = manifest_paths
+            fo.config.default_ml_backend = default_ml_backend
+
+    def test_download_google_drive_file(self):
+        content = os.urandom(10000)
+        sess = _MockSession(content)
+
+        with etau.TempDir() as tmp_dir:
+            path = os.path.join(tmp_dir, "archive.zip")
+
+            with mock.patch.object(fozb.requests, "Session", sess):
+                fozb._download_google_drive_file(
+                    "fid", path, num_workers=4, min_part_size=1000
+                )
+
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), content)
+
+        self.assertDictEqual(sess.params[0], {"id": "fid", "confirm": "t"})
+
+    def test_download_google_drive_file_fallback(self):
+        sess = _MockSession(b"abc", support_ranges=False)
+
+        with etau.TempDir() as tmp_dir:
+            path = os.path.join(tmp_dir, "archive.zip")
+
+            with mock.patch.object(fozb.requests, "Session", sess):
+                with mock.patch.object(
+                    etaw, "download_google_drive_file"
+                ) as download:
+                    fozb._download_google_drive_file(
+                        "fid", path, min_part_size=1
+                    )
+
+            download.assert_called_once_with("fid", path=path)
+
+    def test_download_google_drive_file_failure(self):
+        sess = _MockSession(os.urandom(10000), fail_start=2500)
+
+        with etau.TempDir() as tmp_dir:
+            path = os.path.join(tmp_dir, "archive.zip")
+
+            with mock.patch.object(fozb.requests, "Session", sess):
+                with self.assertRaises(etaw.WebSessionError):
+                    fozb._download_google_drive_file(
+                        "fid", path, num_workers=4, min_part_size=1000
+                    )
+
+            self.assertFalse(os.path.exists(path))
+
+    def test_download_google_drive_file_truncated(self):
+        sess = _MockSession(os.urandom(10000), truncate_start=5000)
+
+        with etau.TempDir() as tmp_dir:
+            path = os.path.join(tmp_dir, "archive.zip")
+
+            with mock.patch.object(fozb.requests, "Session", sess):
+                with self.assertRaises(etaw.WebSessionError):
+                    fozb._download_google_drive_file(
+                        "fid", path, num_workers=4, min_part_size=1000
+                    )
+
+            self.assertFalse(os.path.exists(path))
+
+    def test_extract_zip(self):
+        with etau.TempDir() as tmp_dir:
+            zip_path = os.path.join(tmp_dir, "archive.zip")
+            with zipfile.ZipFile(zip_path, "w") as zf:
+                for i in range(20):
+                    zf.writestr(
+                        "top/sub%d/file%d.txt" % (i % 3, i),
+                        "x" * (100 * i),
+                        compress_type=zipfile.ZIP_DEFLATED,
+                    )
+
+                zf.writestr(
+                    "top/stored.txt",
+                    "stored",
+                    compress_type=zipfile.ZIP_STORED,
+                )
+                zf.writestr("top/empty/", "")
+
+            expected_dir = os.path.join(tmp_dir, "expected")
+            with zipfile.ZipFile(zip_path) as zf:
+                zf.extractall(expected_dir)
+
+            for num_workers in (1, 4):
+                outdir = os.path.join(tmp_dir, "out%d" % num_workers)
+                fozb._extract_zip(zip_path, outdir, num_workers=num_workers)
+
+                self.assertTrue(
+                    os.path.isdir(os.path.join(outdir, "top", "empty"))
+                )
+
+                expected_files = etau.list_files(expected_dir, recursive=True)
+                actual_files = etau.list_files(outdir, recursive=True)
+                self.assertListEqual(actual_files, expected_files)
+
+                for path in expected_files:
+                    with open(os.path.join(expected_dir, path), "rb") as f1:
+                        with open(os.path.join(outdir, path), "rb") as f2:
+                            self.assertEqual(f1.read(), f2.read())
+
+    def test_move_dir(self):
+        with etau.TempDir() as tmp_dir:
+            src = os.path.join(tmp_dir, "src")
+            dst = os.path.join(tmp_dir, "dst")
+            etau.write_file("a", os.path.join(dst, "a.txt"))
+            etau.write_file("b", os.path.join(dst, "sub", "b.txt"))
+            etau.write_file("c", os.path.join(src, "c.txt"))
+            etau.write_file("d", os.path.join(src, "sub2", "d.txt"))
+
+            fozb._move_dir(src, dst)
+
+            self.assertListEqual(os.listdir(src), [])
+            self.assertSetEqual(
+                set(etau.list_files(dst, recursive=True)),
+                {
+                    "a.txt",
+                    "c.txt",
+                    os.path.join("sub", "b.txt"),
+                    os.path.join("sub2", "d.txt"),
+                },
+            )
+
+    def test_move_dir_collision(self):
+        with etau.TempDir() as tmp_dir:
+            src = os.path.join(tmp_dir, "src")
+            dst = os.path.join(tmp_dir, "dst")
+            etau.write_file("new", os.path.join(src, "samples.json"))
+            etau.write_file("old", os.path.join(dst, "samples.json"))
+
+            with self.assertRaises(shutil.Error):
+                fozb._move_dir(src, dst)
+
+            with open(os.path.join(dst, "samples.json")) as f:
+                self.assertEqual(f.read(), "old")
+
+
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
     unittest.main(verbosity=2)